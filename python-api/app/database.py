@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator
 
-from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy import Connection, event, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .models import Game, Move
+from .services.game_logic import reconstruct_board
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_DB_PATH = BASE_DIR / "tic_tac_toe.db"
 
-_engine = None
+_engine: AsyncEngine | None = None
 
 
 def _resolve_database_url(database_url: str | None = None) -> str:
@@ -24,7 +30,7 @@ def _resolve_database_url(database_url: str | None = None) -> str:
     if env_url:
         return _normalize_database_url(env_url)
 
-    return f"sqlite:///{DEFAULT_DB_PATH}"
+    return f"sqlite+aiosqlite:///{DEFAULT_DB_PATH}"
 
 
 def _normalize_database_url(raw_url: str) -> str:
@@ -33,28 +39,89 @@ def _normalize_database_url(raw_url: str) -> str:
         return raw_url.replace("postgres://", "postgresql+psycopg://", 1)
     if raw_url.startswith("postgresql://"):
         return raw_url.replace("postgresql://", "postgresql+psycopg://", 1)
+    # The engine is async; psycopg already speaks asyncio, sqlite needs aiosqlite.
+    if raw_url.startswith("sqlite://"):
+        return raw_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
     return raw_url
 
 
-def init_engine(database_url: str | None = None):
+def init_engine(database_url: str | None = None) -> AsyncEngine:
     global _engine
     resolved_url = _resolve_database_url(database_url)
-    connect_args = {"check_same_thread": False} if resolved_url.startswith("sqlite") else {}
-    _engine = create_engine(resolved_url, connect_args=connect_args, pool_pre_ping=True)
+    if resolved_url.startswith("sqlite"):
+        _engine = create_async_engine(
+            resolved_url,
+            connect_args={"check_same_thread": False},
+            pool_pre_ping=True,
+        )
+        event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    else:
+        _engine = create_async_engine(
+            resolved_url,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            pool_recycle=1800,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+        )
     return _engine
 
 
-def get_engine():
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL with synchronous=NORMAL avoids an fsync on every commit and lets
+    # readers proceed while a move is being written.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=67108864")
+    cursor.close()
+
+
+def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         _engine = init_engine()
     return _engine
 
 
-def create_db_and_tables() -> None:
-    SQLModel.metadata.create_all(get_engine())
+async def create_db_and_tables() -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        await connection.run_sync(_backfill_game_board_columns)
+        await connection.run_sync(_migrate_move_indexes)
+
+
+def _backfill_game_board_columns(connection: Connection) -> None:
+    # Databases created before Game.board/move_count existed need the columns
+    # added and rebuilt once from move history; create_all never alters tables.
+    existing_columns = {column["name"] for column in inspect(connection).get_columns("game")}
+    if {"board", "move_count"} <= existing_columns:
+        return
+
+    if "board" not in existing_columns:
+        connection.execute(text("ALTER TABLE game ADD COLUMN board VARCHAR NOT NULL DEFAULT '.........'"))
+    if "move_count" not in existing_columns:
+        connection.execute(text("ALTER TABLE game ADD COLUMN move_count INTEGER NOT NULL DEFAULT 0"))
+
+    with Session(bind=connection) as session:
+        for game in session.exec(select(Game)).all():
+            statement = select(Move).where(Move.game_id == game.id).order_by(Move.move_number.asc())
+            moves = list(session.exec(statement).all())
+            game.board = reconstruct_board(game.starting_player, moves)
+            game.move_count = len(moves)
+            session.add(game)
+        session.flush()
+
+
+def _migrate_move_indexes(connection: Connection) -> None:
+    # create_all skips indexes on tables that already exist. The composite
+    # (game_id, move_number) index replaces the old single-column one.
+    for index in Move.__table__.indexes:
+        index.create(connection, checkfirst=True)
+    connection.execute(text("DROP INDEX IF EXISTS ix_move_move_number"))
 
 
-def get_session() -> Generator[Session, None, None]:
-    with Session(get_engine()) as session:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(get_engine(), autoflush=False, expire_on_commit=False) as session:
         yield session
@@ -6,21 +6,26 @@ import os
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .database import create_db_and_tables
 from .errors import APIError
 from .routers.games import router as games_router
-from .schemas import ErrorResponse
+from .schemas import ErrorResponse, Position
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    create_db_and_tables()
+    await create_db_and_tables()
     yield
 
 
-app = FastAPI(title="Tic-Tac-Toe API", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Tic-Tac-Toe API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 cors_origins_raw = os.getenv("CORS_ORIGINS", "http://localhost:4000")
 cors_origins = [origin.strip() for origin in cors_origins_raw.split(",") if origin.strip()]
@@ -34,28 +39,34 @@ app.add_middleware(
 )
 
 @app.exception_handler(APIError)
-async def handle_api_error(_, exc: APIError) -> JSONResponse:
-    payload = ErrorResponse(error=exc.error, message=exc.message, valid_moves=exc.valid_moves)
-    return JSONResponse(status_code=exc.status_code, content=payload.model_dump())
+async def handle_api_error(_, exc: APIError) -> ORJSONResponse:
+    valid_moves = [Position(**move) for move in exc.valid_moves] if exc.valid_moves is not None else None
+    payload = ErrorResponse(error=exc.error, message=exc.message, valid_moves=valid_moves)
+    return ORJSONResponse(status_code=exc.status_code, content=payload)
 
 
 @app.exception_handler(RequestValidationError)
-async def handle_validation_error(_, exc: RequestValidationError) -> JSONResponse:
+async def handle_validation_error(_, exc: RequestValidationError) -> ORJSONResponse:
     payload = ErrorResponse(
         error="invalid_payload",
         message="Invalid request payload. Provide integers x and y in the request body.",
     )
-    return JSONResponse(status_code=422, content=payload.model_dump())
+    return ORJSONResponse(status_code=422, content=payload)
+
+
+# Liveness probes hit these constantly, so both return one pre-rendered response.
+# Starlette copies the header list before middleware mutates it, making reuse safe.
+_HEALTH_RESPONSE = ORJSONResponse({"status": "ok"})
 
 
 @app.get("/")
-def root() -> dict[str, str]:
-    return {"status": "ok"}
+async def root() -> ORJSONResponse:
+    return _HEALTH_RESPONSE
 
 
 @app.get("/health")
-def healthcheck() -> dict[str, str]:
-    return {"status": "ok"}
+async def healthcheck() -> ORJSONResponse:
+    return _HEALTH_RESPONSE
 
 
 app.include_router(games_router)
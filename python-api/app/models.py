@@ -1,8 +1,9 @@
+import os
 from datetime import UTC, datetime
 from enum import Enum
 from typing import List, Optional
-from uuid import uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -25,7 +26,7 @@ class BotType(str, Enum):
 
 
 def generate_cuid() -> str:
-    return f"c{uuid4().hex}"
+    return "c" + os.urandom(16).hex()
 
 
 class Game(SQLModel, table=True):
@@ -34,14 +35,18 @@ class Game(SQLModel, table=True):
     starting_player: Player
     bot_type: BotType
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), index=True)
+    board: str = Field(default=".........")
+    move_count: int = Field(default=0)
 
     moves: List["Move"] = Relationship(back_populates="game")
 
 
 class Move(SQLModel, table=True):
+    __table_args__ = (Index("ix_move_game_number", "game_id", "move_number"),)
+
     id: str = Field(default_factory=generate_cuid, primary_key=True, index=True)
     game_id: str = Field(foreign_key="game.id", index=True)
-    move_number: int = Field(index=True)
+    move_number: int
     x: int
     y: int
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, status
-from sqlmodel import Session, select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..database import get_session
 from ..errors import APIError
@@ -26,15 +29,20 @@ from ..services.game_logic import (
     derive_player,
     evaluate_status,
     get_bot_move,
-    reconstruct_board,
+    to_grid,
     valid_moves,
 )
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+# Handlers wrap their response dataclasses in ORJSONResponse themselves. The data
+# is built right here, so FastAPI's jsonable_encoder pass adds nothing; orjson
+# serializes dataclasses, enums and datetimes natively. responses= keeps each
+# schema in OpenAPI.
 
-def _load_game_or_404(session: Session, game_id: str) -> Game:
-    game = session.get(Game, game_id)
+
+async def _load_game_or_404(session: AsyncSession, game_id: str) -> Game:
+    game = await session.get(Game, game_id)
     if game is None:
         raise APIError(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -44,30 +52,65 @@ def _load_game_or_404(session: Session, game_id: str) -> Game:
     return game
 
 
-def _load_moves(session: Session, game_id: str) -> list[Move]:
+async def _commit_move(
+    session: AsyncSession,
+    game: Game,
+    moves: list[Move],
+    board_after: str,
+    status_after: GameStatus,
+) -> None:
+    # Only write if the game is still in progress at the move_count the move was
+    # validated against. A concurrent move bumps move_count and create_game marks
+    # the game abandoned, so in either case this UPDATE matches no row and the
+    # late move is rejected instead of overwriting the stored state.
+    statement = (
+        update(Game)
+        .where(
+            Game.id == game.id,
+            Game.status == GameStatus.in_progress,
+            Game.move_count == game.move_count,
+        )
+        .values(status=status_after, board=board_after, move_count=game.move_count + len(moves))
+    )
+    result = await session.exec(statement)
+    if result.rowcount != 1:
+        await session.rollback()
+        raise APIError(
+            status_code=status.HTTP_409_CONFLICT,
+            error="move_conflict",
+            message="This game changed while your move was being made. Reload it and try again.",
+        )
+
+    session.add_all(moves)
+    await session.commit()
+
+
+async def _load_moves(session: AsyncSession, game_id: str) -> list[Move]:
     statement = select(Move).where(Move.game_id == game_id).order_by(Move.move_number.asc())
-    return list(session.exec(statement).all())
+    return list((await session.exec(statement)).all())
 
 
-@router.post("", response_model=GameCreateResponse, status_code=status.HTTP_201_CREATED)
-def create_game(session: Session = Depends(get_session)) -> GameCreateResponse:
-    active_games_statement = (
-        select(Game)
+@router.post(
+    "",
+    response_model=None,
+    responses={status.HTTP_201_CREATED: {"model": GameCreateResponse}},
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_game(session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
+    abandon_active_statement = (
+        update(Game)
         .where(Game.status == GameStatus.in_progress)
-        .order_by(Game.created_at.desc())
+        .values(status=GameStatus.abandoned)
     )
-    active_games = list(session.exec(active_games_statement).all())
-
-    for active_game in active_games:
-        active_game.status = GameStatus.abandoned
-        session.add(active_game)
+    await session.exec(abandon_active_statement)
 
     previous_completed_statement = (
         select(Game)
         .where(Game.status != GameStatus.in_progress)
         .order_by(Game.created_at.desc())
+        .limit(1)
     )
-    previous_game = session.exec(previous_completed_statement).first()
+    previous_game = (await session.exec(previous_completed_statement)).first()
     previous_starting_player = previous_game.starting_player if previous_game else None
 
     starting_player = choose_starting_player(previous_starting_player)
@@ -79,77 +122,85 @@ def create_game(session: Session = Depends(get_session)) -> GameCreateResponse:
         bot_type=bot_type,
     )
     session.add(game)
-    session.flush()
 
     board = build_empty_board()
-    move_count = 0
     bot_move: Position | None = None
 
     if starting_player == Player.O:
         chosen_move = get_bot_move(board, bot_type)
-        move_count = 1
+        game.move_count = 1
         session.add(
             Move(
                 game_id=game.id,
-                move_number=move_count,
+                move_number=game.move_count,
                 x=chosen_move["x"],
                 y=chosen_move["y"],
             )
         )
         board = apply_move(board, chosen_move["x"], chosen_move["y"], Player.O)
+        game.board = board
         bot_move = Position(**chosen_move)
 
-    session.commit()
+    await session.commit()
 
     message = "You're facing the Chaos Bot!" if bot_type.value == "chaos" else None
 
-    return GameCreateResponse(
-        id=game.id,
-        status=game.status,
-        starting_player=game.starting_player,
-        bot_type=game.bot_type,
-        board=board,
-        current_turn=compute_current_turn(game.status, game.starting_player, move_count),
-        bot_move=bot_move,
-        message=message,
+    return ORJSONResponse(
+        GameCreateResponse(
+            id=game.id,
+            status=game.status,
+            starting_player=game.starting_player,
+            bot_type=game.bot_type,
+            board=to_grid(board),
+            current_turn=compute_current_turn(game.status, game.starting_player, game.move_count),
+            bot_move=bot_move,
+            message=message,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
-@router.get("", response_model=GamesListResponse)
-def list_games(session: Session = Depends(get_session)) -> GamesListResponse:
+@router.get(
+    "",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": GamesListResponse}},
+)
+async def list_games(session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
     statement = select(Game).order_by(Game.created_at.asc())
-    games = list(session.exec(statement).all())
+    games = list((await session.exec(statement)).all())
 
     response_games: list[GameSummary] = []
     for game in games:
-        moves = _load_moves(session, game.id)
-        game_move_count = len(moves)
         final_board = None
         if game.status != GameStatus.in_progress:
-            final_board = reconstruct_board(game.starting_player, moves)
+            final_board = to_grid(game.board)
 
         response_games.append(
             GameSummary(
                 id=game.id,
                 status=game.status,
                 bot_type=game.bot_type,
-                move_count=game_move_count,
+                move_count=game.move_count,
                 created_at=game.created_at,
                 final_board=final_board,
             )
         )
 
-    return GamesListResponse(games=response_games)
+    return ORJSONResponse(GamesListResponse(games=response_games))
 
 
-@router.get("/current", response_model=GameDetailResponse)
-def get_current_game(session: Session = Depends(get_session)) -> GameDetailResponse:
+@router.get(
+    "/current",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": GameDetailResponse}},
+)
+async def get_current_game(session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
     statement = (
         select(Game)
         .where(Game.status == GameStatus.in_progress)
         .order_by(Game.created_at.desc())
     )
-    game = session.exec(statement).first()
+    game = (await session.exec(statement)).first()
 
     if game is None:
         raise APIError(
@@ -158,46 +209,51 @@ def get_current_game(session: Session = Depends(get_session)) -> GameDetailRespo
             message="No in-progress game found.",
         )
 
-    moves = _load_moves(session, game.id)
-    board = reconstruct_board(game.starting_player, moves)
-
-    return GameDetailResponse(
-        id=game.id,
-        status=game.status,
-        starting_player=game.starting_player,
-        bot_type=game.bot_type,
-        created_at=game.created_at,
-        board=board,
-        current_turn=compute_current_turn(game.status, game.starting_player, len(moves)),
+    return ORJSONResponse(
+        GameDetailResponse(
+            id=game.id,
+            status=game.status,
+            starting_player=game.starting_player,
+            bot_type=game.bot_type,
+            created_at=game.created_at,
+            board=to_grid(game.board),
+            current_turn=compute_current_turn(game.status, game.starting_player, game.move_count),
+        )
     )
 
 
-@router.get("/{game_id}", response_model=GameDetailResponse)
-def get_game(game_id: str, session: Session = Depends(get_session)) -> GameDetailResponse:
-    game = _load_game_or_404(session, game_id)
-    moves = _load_moves(session, game.id)
-    board = reconstruct_board(game.starting_player, moves)
-
-    return GameDetailResponse(
-        id=game.id,
-        status=game.status,
-        starting_player=game.starting_player,
-        bot_type=game.bot_type,
-        created_at=game.created_at,
-        board=board,
-        current_turn=compute_current_turn(game.status, game.starting_player, len(moves)),
+@router.get(
+    "/{game_id}",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": GameDetailResponse}},
+)
+async def get_game(game_id: str, session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
+    game = await _load_game_or_404(session, game_id)
+    return ORJSONResponse(
+        GameDetailResponse(
+            id=game.id,
+            status=game.status,
+            starting_player=game.starting_player,
+            bot_type=game.bot_type,
+            created_at=game.created_at,
+            board=to_grid(game.board),
+            current_turn=compute_current_turn(game.status, game.starting_player, game.move_count),
+        )
     )
 
 
-@router.post("/{game_id}/moves", response_model=GameMoveResponse)
-def make_move(
+@router.post(
+    "/{game_id}/moves",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": GameMoveResponse}},
+)
+async def make_move(
     game_id: str,
     move_input: MoveRequest,
-    session: Session = Depends(get_session),
-) -> GameMoveResponse:
-    game = _load_game_or_404(session, game_id)
-    moves = _load_moves(session, game.id)
-    board = reconstruct_board(game.starting_player, moves)
+    session: AsyncSession = Depends(get_session),
+) -> ORJSONResponse:
+    game = await _load_game_or_404(session, game_id)
+    board = game.board
 
     if game.status != GameStatus.in_progress:
         raise APIError(
@@ -215,7 +271,7 @@ def make_move(
             valid_moves=valid_moves(board),
         )
 
-    current_turn = compute_current_turn(game.status, game.starting_player, len(moves))
+    current_turn = compute_current_turn(game.status, game.starting_player, game.move_count)
     if current_turn != Player.X:
         raise APIError(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -224,7 +280,7 @@ def make_move(
             valid_moves=valid_moves(board),
         )
 
-    if board[move_input.y][move_input.x] != ".":
+    if board[move_input.y * 3 + move_input.x] != ".":
         raise APIError(
             status_code=status.HTTP_400_BAD_REQUEST,
             error="cell_occupied",
@@ -232,62 +288,62 @@ def make_move(
             valid_moves=valid_moves(board),
         )
 
-    next_move_number = len(moves) + 1
-    session.add(
-        Move(
-            game_id=game.id,
-            move_number=next_move_number,
-            x=move_input.x,
-            y=move_input.y,
-        )
+    next_move_number = game.move_count + 1
+    human_move = Move(
+        game_id=game.id,
+        move_number=next_move_number,
+        x=move_input.x,
+        y=move_input.y,
     )
 
     board_after_human = apply_move(board, move_input.x, move_input.y, Player.X)
     status_after_human = evaluate_status(board_after_human)
 
     if status_after_human != GameStatus.in_progress:
-        game.status = status_after_human
-        session.add(game)
-        session.commit()
-
-        return GameMoveResponse(
-            board=board_after_human,
-            status=status_after_human,
-            current_turn=None,
-            bot_move=None,
-            message=None,
+        await _commit_move(session, game, [human_move], board_after_human, status_after_human)
+
+        return ORJSONResponse(
+            GameMoveResponse(
+                board=to_grid(board_after_human),
+                status=status_after_human,
+                current_turn=None,
+                bot_move=None,
+                message=None,
+            )
         )
 
     chosen_bot_move = get_bot_move(board_after_human, game.bot_type)
     bot_move_number = next_move_number + 1
-    session.add(
-        Move(
-            game_id=game.id,
-            move_number=bot_move_number,
-            x=chosen_bot_move["x"],
-            y=chosen_bot_move["y"],
-        )
+    bot_move = Move(
+        game_id=game.id,
+        move_number=bot_move_number,
+        x=chosen_bot_move["x"],
+        y=chosen_bot_move["y"],
     )
 
     board_after_bot = apply_move(board_after_human, chosen_bot_move["x"], chosen_bot_move["y"], Player.O)
     status_after_bot = evaluate_status(board_after_bot)
-    game.status = status_after_bot
-    session.add(game)
-    session.commit()
-
-    return GameMoveResponse(
-        board=board_after_bot,
-        status=status_after_bot,
-        current_turn=compute_current_turn(status_after_bot, game.starting_player, bot_move_number),
-        bot_move=Position(**chosen_bot_move),
-        message=None,
+    await _commit_move(session, game, [human_move, bot_move], board_after_bot, status_after_bot)
+
+    return ORJSONResponse(
+        GameMoveResponse(
+            board=to_grid(board_after_bot),
+            status=status_after_bot,
+            current_turn=compute_current_turn(status_after_bot, game.starting_player, bot_move_number),
+            bot_move=Position(**chosen_bot_move),
+            message=None,
+        )
     )
 
 
-@router.get("/{game_id}/moves", response_model=MovesListResponse)
-def get_game_moves(game_id: str, session: Session = Depends(get_session)) -> MovesListResponse:
-    game = _load_game_or_404(session, game_id)
-    moves = _load_moves(session, game.id)
+@router.get(
+    "/{game_id}/moves",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": MovesListResponse}},
+)
+async def get_game_moves(game_id: str, session: AsyncSession = Depends(get_session)) -> ORJSONResponse:
+    game = await _load_game_or_404(session, game_id)
+    moves = await _load_moves(session, game.id)
 
     move_items: list[MoveHistoryItem] = []
     for move in moves:
@@ -302,4 +358,4 @@ def get_game_moves(game_id: str, session: Session = Depends(get_session)) -> Mov
             )
         )
 
-    return MovesListResponse(game_id=game.id, moves=move_items)
+    return ORJSONResponse(MovesListResponse(game_id=game.id, moves=move_items))
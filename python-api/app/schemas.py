@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 
 from sqlmodel import SQLModel
@@ -9,23 +10,28 @@ from .models import BotType, GameStatus, Player
 Board = list[list[str]]
 
 
-class Position(SQLModel):
+@dataclass(slots=True)
+class Position:
     x: int
     y: int
 
 
+# Request bodies stay SQLModel so FastAPI validates them; responses are plain
+# dataclasses built from trusted data and serialized by orjson.
 class MoveRequest(SQLModel):
     x: int
     y: int
 
 
-class ErrorResponse(SQLModel):
+@dataclass(slots=True)
+class ErrorResponse:
     error: str
     message: str
     valid_moves: list[Position] | None = None
 
 
-class GameCreateResponse(SQLModel):
+@dataclass(slots=True)
+class GameCreateResponse:
     id: str
     status: GameStatus
     starting_player: Player
@@ -36,7 +42,8 @@ class GameCreateResponse(SQLModel):
     message: str | None = None
 
 
-class GameMoveResponse(SQLModel):
+@dataclass(slots=True)
+class GameMoveResponse:
     board: Board
     status: GameStatus
     current_turn: Player | None
@@ -44,7 +51,8 @@ class GameMoveResponse(SQLModel):
     message: str | None = None
 
 
-class GameSummary(SQLModel):
+@dataclass(slots=True)
+class GameSummary:
     id: str
     status: GameStatus
     bot_type: BotType
@@ -53,11 +61,13 @@ class GameSummary(SQLModel):
     final_board: Board | None
 
 
-class GamesListResponse(SQLModel):
+@dataclass(slots=True)
+class GamesListResponse:
     games: list[GameSummary]
 
 
-class GameDetailResponse(SQLModel):
+@dataclass(slots=True)
+class GameDetailResponse:
     id: str
     status: GameStatus
     starting_player: Player
@@ -67,7 +77,8 @@ class GameDetailResponse(SQLModel):
     current_turn: Player | None
 
 
-class MoveHistoryItem(SQLModel):
+@dataclass(slots=True)
+class MoveHistoryItem:
     id: str
     move_number: int
     x: int
@@ -76,6 +87,7 @@ class MoveHistoryItem(SQLModel):
     created_at: datetime
 
 
-class MovesListResponse(SQLModel):
+@dataclass(slots=True)
+class MovesListResponse:
     game_id: str
     moves: list[MoveHistoryItem]
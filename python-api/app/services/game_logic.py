@@ -1,33 +1,54 @@
 from __future__ import annotations
 
+import os
 import random
+from collections import deque
+from functools import lru_cache
 from typing import Any, Sequence
 
 from ..models import BotType, GameStatus, Player
 
-Board = list[list[str]]
-WIN_LINES = [
-    [(0, 0), (1, 0), (2, 0)],
-    [(0, 1), (1, 1), (2, 1)],
-    [(0, 2), (1, 2), (2, 2)],
-    [(0, 0), (0, 1), (0, 2)],
-    [(1, 0), (1, 1), (1, 2)],
-    [(2, 0), (2, 1), (2, 2)],
-    [(0, 0), (1, 1), (2, 2)],
-    [(0, 2), (1, 1), (2, 0)],
-]
+# Boards are 9-character strings in row-major order: cell (x, y) is index
+# y * 3 + x. Callers expand them with to_grid at the response boundary.
+Board = str
+EMPTY_BOARD = "........."
+# Internal (x, y) coordinates; public helpers return fresh {"x", "y"} dicts.
+Cell = tuple[int, int]
+
+# Enum members and their cell strings, bound once so hot paths skip attribute
+# lookups. Compare with == rather than is: callers may pass raw strings.
+_X = Player.X
+_O = Player.O
+_X_CELL = _X.value
+_O_CELL = _O.value
+
+# Module-level generator for bot randomness; tests may monkeypatch it.
+_rng = random.Random()
+
+# Bitboard layout: cell (x, y) is bit y * 3 + x, one mask per player. Each octal
+# digit is one row with the top row lowest, so 0o007 is the top row.
+_FULL_MASK = 0o777
+_WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+# Whether each of the 512 possible masks contains a full line.
+_HAS_LINE = tuple(
+    any(mask & win_mask == win_mask for win_mask in _WIN_MASKS) for mask in range(_FULL_MASK + 1)
+)
 
 
 def build_empty_board() -> Board:
-    return [[".", ".", "."], [".", ".", "."], [".", ".", "."]]
+    return EMPTY_BOARD
+
+
+def to_grid(board: Board) -> list[list[str]]:
+    return [list(board[row * 3 : (row + 1) * 3]) for row in range(3)]
 
 
 def other_player(player: Player) -> Player:
-    return Player.O if player == Player.X else Player.X
+    return _O if player == _X else _X
 
 
 def derive_player(starting_player: Player, move_number: int) -> Player:
-    return starting_player if move_number % 2 == 1 else other_player(starting_player)
+    return starting_player if move_number & 1 else other_player(starting_player)
 
 
 def _read_move_coordinate(move: Any, key: str) -> int:
@@ -37,90 +58,172 @@ def _read_move_coordinate(move: Any, key: str) -> int:
 
 
 def reconstruct_board(starting_player: Player, moves: Sequence[Any]) -> Board:
-    board = build_empty_board()
+    cells = list(EMPTY_BOARD)
 
     for move in moves:
         move_number = _read_move_coordinate(move, "move_number")
         x = _read_move_coordinate(move, "x")
         y = _read_move_coordinate(move, "y")
         player = derive_player(starting_player, move_number)
-        board[y][x] = player.value
+        cells[y * 3 + x] = player.value
+
+    return "".join(cells)
 
-    return board
 
+def board_to_masks(board: Board) -> tuple[int, int]:
+    x_mask = 0
+    o_mask = 0
+    for index, cell in enumerate(board):
+        if cell == _X_CELL:
+            x_mask |= 1 << index
+        elif cell == _O_CELL:
+            o_mask |= 1 << index
+    return x_mask, o_mask
 
-def get_empty_cells(board: Board) -> list[dict[str, int]]:
-    empty_cells: list[dict[str, int]] = []
-    for y in range(3):
-        for x in range(3):
-            if board[y][x] == ".":
-                empty_cells.append({"x": x, "y": y})
+
+def check_winner_masks(x_mask: int, o_mask: int) -> Player | None:
+    if _HAS_LINE[x_mask]:
+        return Player.X
+    if _HAS_LINE[o_mask]:
+        return Player.O
+    return None
+
+
+def _empty_cells_from_masks(x_mask: int, o_mask: int) -> list[Cell]:
+    empty_cells: list[Cell] = []
+    empty = ~(x_mask | o_mask) & _FULL_MASK
+    while empty:
+        index = (empty & -empty).bit_length() - 1
+        empty_cells.append((index % 3, index // 3))
+        empty &= empty - 1
     return empty_cells
 
 
+def _to_position(cell: Cell) -> dict[str, int]:
+    return {"x": cell[0], "y": cell[1]}
+
+
+# The board helpers below are pure functions of a 9-character string, so they
+# are memoized; 20000 entries covers all 3**9 possible strings. Cached results
+# are immutable, so sharing them between callers is safe.
+@lru_cache(maxsize=20000)
+def get_empty_cells(board: Board) -> tuple[Cell, ...]:
+    return tuple(_empty_cells_from_masks(*board_to_masks(board)))
+
+
 def valid_moves(board: Board) -> list[dict[str, int]]:
-    return get_empty_cells(board)
+    return [_to_position(cell) for cell in get_empty_cells(board)]
 
 
+@lru_cache(maxsize=20000)
 def check_winner(board: Board) -> Player | None:
-    for line in WIN_LINES:
-        (ax, ay), (bx, by), (cx, cy) = line
-        cell_a = board[ay][ax]
-        cell_b = board[by][bx]
-        cell_c = board[cy][cx]
-        if cell_a != "." and cell_a == cell_b and cell_b == cell_c:
-            return Player(cell_a)
-    return None
+    return check_winner_masks(*board_to_masks(board))
 
 
+@lru_cache(maxsize=20000)
 def is_draw(board: Board) -> bool:
-    return all(cell != "." for row in board for cell in row)
+    x_mask, o_mask = board_to_masks(board)
+    return x_mask | o_mask == _FULL_MASK
 
 
+@lru_cache(maxsize=20000)
 def evaluate_status(board: Board) -> GameStatus:
-    winner = check_winner(board)
+    x_mask, o_mask = board_to_masks(board)
+    winner = check_winner_masks(x_mask, o_mask)
     if winner == Player.X:
         return GameStatus.x_wins
     if winner == Player.O:
         return GameStatus.o_wins
-    if is_draw(board):
+    if x_mask | o_mask == _FULL_MASK:
         return GameStatus.draw
     return GameStatus.in_progress
 
 
 def apply_move(board: Board, x: int, y: int, player: Player) -> Board:
-    next_board = [row[:] for row in board]
-    next_board[y][x] = player.value
-    return next_board
+    index = y * 3 + x
+    return board[:index] + player.value + board[index + 1 :]
 
 
-def find_winning_move(board: Board, player: Player) -> dict[str, int] | None:
-    for cell in get_empty_cells(board):
-        candidate = apply_move(board, cell["x"], cell["y"], player)
-        if check_winner(candidate) == player:
+def _find_winning_cell(player_mask: int, empty_cells: list[Cell]) -> Cell | None:
+    for cell in empty_cells:
+        if _HAS_LINE[player_mask | 1 << (cell[1] * 3 + cell[0])]:
             return cell
     return None
 
 
+def find_winning_move(board: Board, player: Player) -> dict[str, int] | None:
+    x_mask, o_mask = board_to_masks(board)
+    player_mask = x_mask if player == Player.X else o_mask
+    cell = _find_winning_cell(player_mask, _empty_cells_from_masks(x_mask, o_mask))
+    return _to_position(cell) if cell else None
+
+
+def _forced_move(x_mask: int, o_mask: int) -> Cell | None:
+    empty_cells = _empty_cells_from_masks(x_mask, o_mask)
+    return _find_winning_cell(o_mask, empty_cells) or _find_winning_cell(x_mask, empty_cells)
+
+
+def _build_smart_policy() -> dict[tuple[int, int], Cell | None]:
+    # Walk every reachable position from an empty board (either player may start)
+    # and record the smart bot's win/block move for each non-terminal position.
+    # A None entry means no forced move, so the bot falls back to a random cell.
+    policy: dict[tuple[int, int], Cell | None] = {}
+    seen: set[tuple[int, int, Player]] = set()
+    queue = deque([(0, 0, Player.X), (0, 0, Player.O)])
+
+    while queue:
+        state = queue.popleft()
+        if state in seen:
+            continue
+        seen.add(state)
+
+        x_mask, o_mask, to_move = state
+        if x_mask | o_mask == _FULL_MASK or check_winner_masks(x_mask, o_mask):
+            continue
+
+        if to_move == Player.O:
+            policy[(x_mask, o_mask)] = _forced_move(x_mask, o_mask)
+
+        for x, y in _empty_cells_from_masks(x_mask, o_mask):
+            bit = 1 << (y * 3 + x)
+            if to_move == Player.X:
+                queue.append((x_mask | bit, o_mask, Player.O))
+            else:
+                queue.append((x_mask, o_mask | bit, Player.X))
+
+    return policy
+
+
+def _policy_enabled() -> bool:
+    # Set TICTACTOE_SMART_POLICY=0 to always compute smart moves live.
+    return os.getenv("TICTACTOE_SMART_POLICY", "1") != "0"
+
+
+_SMART_POLICY = _build_smart_policy() if _policy_enabled() else None
+
+
+def _smart_forced_move(x_mask: int, o_mask: int) -> Cell | None:
+    key = (x_mask, o_mask)
+    if _SMART_POLICY is not None and key in _SMART_POLICY:
+        return _SMART_POLICY[key]
+    return _forced_move(x_mask, o_mask)
+
+
 def get_bot_move(board: Board, bot_type: BotType) -> dict[str, int]:
-    empty_cells = get_empty_cells(board)
-    if not empty_cells:
+    x_mask, o_mask = board_to_masks(board)
+    if x_mask | o_mask == _FULL_MASK:
         raise ValueError("No valid bot moves available")
 
     if bot_type == BotType.smart:
-        winning = find_winning_move(board, Player.O)
-        if winning:
-            return winning
-
-        blocking = find_winning_move(board, Player.X)
-        if blocking:
-            return blocking
+        forced = _smart_forced_move(x_mask, o_mask)
+        if forced:
+            return _to_position(forced)
 
-    return random.choice(empty_cells)
+    return _to_position(_rng.choice(_empty_cells_from_masks(x_mask, o_mask)))
 
 
 def choose_bot_type() -> BotType:
-    return BotType.chaos if random.random() < 0.1 else BotType.smart
+    return BotType.chaos if _rng.random() < 0.1 else BotType.smart
 
 
 def choose_starting_player(previous_starting_player: Player | None) -> Player:
@@ -132,6 +235,6 @@ def choose_starting_player(previous_starting_player: Player | None) -> Player:
 def compute_current_turn(status: GameStatus, starting_player: Player, move_count: int) -> Player | None:
     if status != GameStatus.in_progress:
         return None
-    if move_count % 2 == 0:
-        return starting_player
-    return other_player(starting_player)
+    if move_count & 1:
+        return other_player(starting_player)
+    return starting_player
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel
@@ -8,15 +10,24 @@ from app.database import get_engine, init_engine
 from app.main import app
 
 
+async def _reset_schema(*, recreate: bool) -> None:
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.drop_all)
+        if recreate:
+            await connection.run_sync(SQLModel.metadata.create_all)
+    # Pooled aiosqlite connections must not outlive the event loop that made them.
+    await engine.dispose()
+
+
 @pytest.fixture(autouse=True)
 def isolate_database(tmp_path):
     db_file = tmp_path / "test.db"
     init_engine(f"sqlite:///{db_file}")
 
-    SQLModel.metadata.drop_all(get_engine())
-    SQLModel.metadata.create_all(get_engine())
+    asyncio.run(_reset_schema(recreate=True))
     yield
-    SQLModel.metadata.drop_all(get_engine())
+    asyncio.run(_reset_schema(recreate=False))
 
 
 @pytest.fixture
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import sqlite3
+
+from sqlalchemy import event
+
+from app.database import get_engine
 from app.models import BotType
 
 
@@ -11,7 +16,7 @@ def _first_empty(board: list[list[str]]) -> dict[str, int]:
     raise AssertionError("No empty cells available")
 
 
-def _deterministic_bot_move(board: list[list[str]], _bot_type: BotType) -> dict[str, int]:
+def _deterministic_bot_move(board: str, _bot_type: BotType) -> dict[str, int]:
     preferred_order = [
         {"x": 0, "y": 2},
         {"x": 1, "y": 2},
@@ -25,7 +30,7 @@ def _deterministic_bot_move(board: list[list[str]], _bot_type: BotType) -> dict[
     ]
 
     for candidate in preferred_order:
-        if board[candidate["y"]][candidate["x"]] == ".":
+        if board[candidate["y"] * 3 + candidate["x"]] == ".":
             return candidate
 
     raise AssertionError("Bot had no move")
@@ -180,3 +185,82 @@ def test_human_win_has_no_bot_counter_move(client, monkeypatch):
     payload = winning.json()
     assert payload["status"] == "x_wins"
     assert payload["bot_move"] is None
+
+
+def test_get_games_reports_move_count_per_game(client, monkeypatch):
+    monkeypatch.setattr("app.routers.games.get_bot_move", _deterministic_bot_move)
+
+    first = client.post("/games").json()
+    client.post(f"/games/{first['id']}/moves", json=_first_empty(first["board"]))
+    second = client.post("/games").json()
+
+    games = {game["id"]: game for game in client.get("/games").json()["games"]}
+
+    assert games[first["id"]]["move_count"] == 3
+    assert games[second["id"]]["move_count"] == 0
+
+
+def test_make_move_reads_only_the_game_row(client, monkeypatch):
+    monkeypatch.setattr("app.routers.games.get_bot_move", _deterministic_bot_move)
+
+    game = client.post("/games").json()
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(get_engine().sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.post(f"/games/{game['id']}/moves", json=_first_empty(game["board"]))
+    finally:
+        event.remove(get_engine().sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    selects = [statement for statement in statements if statement.startswith("SELECT")]
+    assert len(selects) == 1
+    assert "FROM game" in selects[0]
+
+
+def test_healthcheck_response_is_reusable_across_requests(client):
+    for _ in range(2):
+        response = client.get("/health", headers={"Origin": "http://localhost:4000"})
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        assert response.headers.get_list("access-control-allow-origin") == ["http://localhost:4000"]
+
+
+def test_make_move_rejects_concurrent_move_on_same_game(client, monkeypatch):
+    game = client.post("/games").json()
+
+    def concurrent_bot_move(board: str, bot_type: BotType) -> dict[str, int]:
+        # Another request lands its move while this one is still choosing the bot's reply.
+        with sqlite3.connect(get_engine().url.database) as connection:
+            connection.execute("UPDATE game SET move_count = move_count + 2 WHERE id = ?", (game["id"],))
+        return _deterministic_bot_move(board, bot_type)
+
+    monkeypatch.setattr("app.routers.games.get_bot_move", concurrent_bot_move)
+
+    response = client.post(f"/games/{game['id']}/moves", json=_first_empty(game["board"]))
+    assert response.status_code == 409
+    assert response.json()["error"] == "move_conflict"
+
+    moves = client.get(f"/games/{game['id']}/moves").json()["moves"]
+    assert len(moves) == (1 if game["starting_player"] == "O" else 0)
+
+
+def test_make_move_rejects_move_on_game_abandoned_mid_move(client, monkeypatch):
+    game = client.post("/games").json()
+
+    def abandoning_bot_move(board: str, bot_type: BotType) -> dict[str, int]:
+        # A new game is created while this request is still choosing the bot's reply.
+        with sqlite3.connect(get_engine().url.database) as connection:
+            connection.execute("UPDATE game SET status = 'abandoned' WHERE id = ?", (game["id"],))
+        return _deterministic_bot_move(board, bot_type)
+
+    monkeypatch.setattr("app.routers.games.get_bot_move", abandoning_bot_move)
+
+    response = client.post(f"/games/{game['id']}/moves", json=_first_empty(game["board"]))
+    assert response.status_code == 409
+    assert response.json()["error"] == "move_conflict"
+
+    assert client.get(f"/games/{game['id']}").json()["status"] == "abandoned"
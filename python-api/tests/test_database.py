@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import create_db_and_tables, get_engine
+from app.models import Game
+
+
+async def _migrate_legacy_schema() -> tuple[Game, set[str]]:
+    engine = get_engine()
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.drop_all)
+        await connection.execute(
+            text(
+                "CREATE TABLE game (id VARCHAR PRIMARY KEY, status VARCHAR NOT NULL, "
+                "starting_player VARCHAR NOT NULL, bot_type VARCHAR NOT NULL, created_at DATETIME NOT NULL)"
+            )
+        )
+        await connection.execute(
+            text(
+                "CREATE TABLE move (id VARCHAR PRIMARY KEY, game_id VARCHAR NOT NULL REFERENCES game (id), "
+                "move_number INTEGER NOT NULL, x INTEGER NOT NULL, y INTEGER NOT NULL, created_at DATETIME NOT NULL)"
+            )
+        )
+        await connection.execute(text("CREATE INDEX ix_move_move_number ON move (move_number)"))
+        await connection.execute(text("INSERT INTO game VALUES ('c1', 'in_progress', 'O', 'smart', '2024-01-01 00:00:00')"))
+        await connection.execute(
+            text(
+                "INSERT INTO move VALUES "
+                "('m1', 'c1', 1, 0, 0, '2024-01-01 00:00:00'), "
+                "('m2', 'c1', 2, 1, 1, '2024-01-01 00:00:01')"
+            )
+        )
+
+    await create_db_and_tables()
+
+    async with AsyncSession(engine) as session:
+        game = await session.get(Game, "c1")
+    async with engine.connect() as connection:
+        move_indexes = await connection.run_sync(
+            lambda sync_connection: {index["name"] for index in inspect(sync_connection).get_indexes("move")}
+        )
+    await engine.dispose()
+    return game, move_indexes
+
+
+def test_create_db_and_tables_migrates_legacy_schema():
+    game, move_indexes = asyncio.run(_migrate_legacy_schema())
+
+    assert game.board == "O...X...."
+    assert game.move_count == 2
+    assert "ix_move_game_number" in move_indexes
+    assert "ix_move_move_number" not in move_indexes
+
+
+async def _read_pragmas() -> tuple[str, int]:
+    engine = get_engine()
+    async with engine.connect() as connection:
+        journal_mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+        synchronous = (await connection.execute(text("PRAGMA synchronous"))).scalar()
+    await engine.dispose()
+    return journal_mode, synchronous
+
+
+def test_sqlite_connections_use_wal_journal():
+    assert asyncio.run(_read_pragmas()) == ("wal", 1)
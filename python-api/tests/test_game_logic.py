@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from app.models import BotType, Player
+from app.models import BotType, GameStatus, Player
+from app.services import game_logic
 from app.services.game_logic import (
+    EMPTY_BOARD,
+    _build_smart_policy,
     apply_move,
+    board_to_masks,
     check_winner,
+    check_winner_masks,
+    choose_bot_type,
     choose_starting_player,
+    compute_current_turn,
+    derive_player,
+    evaluate_status,
+    find_winning_move,
     get_bot_move,
     is_draw,
+    other_player,
     reconstruct_board,
+    to_grid,
+    valid_moves,
 )
 
 
@@ -24,18 +37,18 @@ def test_check_winner_all_lines():
     ]
 
     for line in line_sets:
-        board = [[".", ".", "."], [".", ".", "."], [".", ".", "."]]
+        board = "........."
         for x, y in line:
-            board[y][x] = "X"
+            board = apply_move(board, x, y, Player.X)
         assert check_winner(board) == Player.X
 
 
 def test_is_draw_true_when_board_full_without_winner():
-    board = [
-        ["X", "O", "X"],
-        ["X", "O", "O"],
-        ["O", "X", "X"],
-    ]
+    board = (
+        "XOX"
+        "XOO"
+        "OXX"
+    )
     assert is_draw(board) is True
 
 
@@ -47,41 +60,41 @@ def test_reconstruct_board_from_move_history():
     ]
 
     board = reconstruct_board(Player.O, moves)
-    assert board == [
-        ["O", ".", "."],
-        [".", "X", "."],
-        [".", ".", "O"],
-    ]
+    assert board == (
+        "O.."
+        ".X."
+        "..O"
+    )
 
 
 def test_smart_bot_prioritizes_winning_move():
-    board = [
-        ["O", "O", "."],
-        ["X", "X", "."],
-        [".", ".", "."],
-    ]
+    board = (
+        "OO."
+        "XX."
+        "..."
+    )
 
     move = get_bot_move(board, BotType.smart)
     assert move == {"x": 2, "y": 0}
 
 
 def test_smart_bot_blocks_human_if_no_win_available():
-    board = [
-        ["X", "X", "."],
-        [".", "O", "."],
-        [".", ".", "."],
-    ]
+    board = (
+        "XX."
+        ".O."
+        "..."
+    )
 
     move = get_bot_move(board, BotType.smart)
     assert move == {"x": 2, "y": 0}
 
 
 def test_chaos_bot_selects_only_empty_cells():
-    board = [
-        ["X", "O", "X"],
-        ["O", ".", "X"],
-        [".", "O", "X"],
-    ]
+    board = (
+        "XOX"
+        "O.X"
+        ".OX"
+    )
 
     for _ in range(20):
         move = get_bot_move(board, BotType.chaos)
@@ -95,8 +108,161 @@ def test_choose_starting_player_alternates():
 
 
 def test_apply_move_sets_expected_cell():
-    board = [[".", ".", "."], [".", ".", "."], [".", ".", "."]]
+    board = "........."
     updated = apply_move(board, 1, 2, Player.X)
 
-    assert board[2][1] == "."
-    assert updated[2][1] == "X"
+    assert board == "........."
+    assert updated == ".......X."
+
+
+def test_board_to_masks_sets_one_bit_per_cell():
+    board = (
+        "X.O"
+        ".X."
+        "O.."
+    )
+
+    assert board_to_masks(board) == (0b000010001, 0b001000100)
+
+
+def _reachable_o_to_move_boards() -> set[str]:
+    boards: set[str] = set()
+    seen: set[tuple[str, Player]] = set()
+    stack = [(EMPTY_BOARD, Player.X), (EMPTY_BOARD, Player.O)]
+
+    while stack:
+        board, to_move = stack.pop()
+        if (board, to_move) in seen:
+            continue
+        seen.add((board, to_move))
+        if evaluate_status(board) != GameStatus.in_progress:
+            continue
+
+        if to_move == Player.O:
+            boards.add(board)
+        next_player = Player.X if to_move == Player.O else Player.O
+        for cell in valid_moves(board):
+            stack.append((apply_move(board, cell["x"], cell["y"], to_move), next_player))
+
+    return boards
+
+
+def test_smart_policy_covers_every_reachable_position(monkeypatch):
+    monkeypatch.setattr(game_logic, "_SMART_POLICY", _build_smart_policy())
+    boards = _reachable_o_to_move_boards()
+
+    assert len(boards) == len(game_logic._SMART_POLICY) == 4520
+
+    for board in boards:
+        assert board_to_masks(board) in game_logic._SMART_POLICY
+        expected = find_winning_move(board, Player.O) or find_winning_move(board, Player.X)
+        move = get_bot_move(board, BotType.smart)
+        if expected:
+            assert move == expected
+        else:
+            assert move in valid_moves(board)
+
+
+def test_get_bot_move_reads_smart_policy_table(monkeypatch):
+    board = (
+        "OO."
+        "XX."
+        "..."
+    )
+    policy = _build_smart_policy()
+    policy[board_to_masks(board)] = (0, 2)
+    monkeypatch.setattr(game_logic, "_SMART_POLICY", policy)
+
+    assert get_bot_move(board, BotType.smart) == {"x": 0, "y": 2}
+
+
+def test_smart_policy_env_var_controls_policy_table(monkeypatch):
+    monkeypatch.delenv("TICTACTOE_SMART_POLICY", raising=False)
+    assert game_logic._policy_enabled()
+
+    monkeypatch.setenv("TICTACTOE_SMART_POLICY", "1")
+    assert game_logic._policy_enabled()
+
+    monkeypatch.setenv("TICTACTOE_SMART_POLICY", "0")
+    assert not game_logic._policy_enabled()
+
+
+def test_get_bot_move_falls_back_to_live_scan_without_policy(monkeypatch):
+    monkeypatch.setattr(game_logic, "_SMART_POLICY", None)
+
+    assert get_bot_move("OO." "XX." "...", BotType.smart) == {"x": 2, "y": 0}
+    assert get_bot_move("XX." ".O." "...", BotType.smart) == {"x": 2, "y": 0}
+
+
+def test_find_winning_move_for_each_player():
+    board = (
+        "XO."
+        "XO."
+        "..."
+    )
+
+    assert find_winning_move(board, Player.X) == {"x": 0, "y": 2}
+    assert find_winning_move(board, Player.O) == {"x": 1, "y": 2}
+    assert find_winning_move(EMPTY_BOARD, Player.X) is None
+
+
+def test_to_grid_expands_rows():
+    assert to_grid("XO." "..." "..O") == [
+        ["X", "O", "."],
+        [".", ".", "."],
+        [".", ".", "O"],
+    ]
+
+
+def test_choose_bot_type_uses_module_rng(monkeypatch):
+    monkeypatch.setattr(game_logic._rng, "random", lambda: 0.05)
+    assert choose_bot_type() == BotType.chaos
+
+    monkeypatch.setattr(game_logic._rng, "random", lambda: 0.5)
+    assert choose_bot_type() == BotType.smart
+
+
+def test_check_winner_masks_reports_either_player():
+    assert check_winner_masks(0o124, 0o003) == Player.X
+    assert check_winner_masks(0o003, 0o444) == Player.O
+    assert check_winner_masks(0o003, 0o440) is None
+
+
+def test_derive_player_and_current_turn_alternate_from_starting_player():
+    assert [derive_player(Player.O, number) for number in range(1, 5)] == [Player.O, Player.X, Player.O, Player.X]
+    assert [derive_player(Player.X, number) for number in range(1, 5)] == [Player.X, Player.O, Player.X, Player.O]
+
+    assert compute_current_turn(GameStatus.in_progress, Player.O, 0) == Player.O
+    assert compute_current_turn(GameStatus.in_progress, Player.O, 1) == Player.X
+    assert compute_current_turn(GameStatus.draw, Player.O, 9) is None
+
+
+def test_turn_helpers_accept_raw_string_values():
+    assert other_player("X") == Player.O
+    assert compute_current_turn("in_progress", "X", 1) == Player.O
+
+
+def test_bot_move_results_are_not_shared_between_calls():
+    board = (
+        "OO."
+        "XX."
+        "..."
+    )
+
+    move = get_bot_move(board, BotType.smart)
+    move["x"] = 99
+
+    assert get_bot_move(board, BotType.smart) == {"x": 2, "y": 0}
+
+
+def test_valid_moves_returns_fresh_dicts():
+    board = (
+        "XO."
+        "..."
+        "..."
+    )
+
+    moves = valid_moves(board)
+    moves[0]["x"] = 99
+
+    assert valid_moves(board)[0] == {"x": 2, "y": 0}